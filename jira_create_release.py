@@ -14,13 +14,30 @@ Example:
 """
 
 import argparse
+import asyncio
+import logging
 import os
 import sys
+import aiohttp
+import orjson
 import requests
-import json
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
 
 class JiraReleaseCreator:
+    # Bound on concurrent requests against the JIRA API, to stay under
+    # Atlassian Cloud rate limits.
+    MAX_CONCURRENT_REQUESTS = 16
+
+    # Retry policy for transient failures (rate limits and server errors),
+    # shared between the requests and aiohttp paths.
+    MAX_RETRIES = 5
+    RETRY_BACKOFF_FACTOR = 0.5
+    RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
     def __init__(self, release_name, project_name, ticket_status):
         """
         Initialize the JIRA Release Creator.
@@ -40,9 +57,28 @@ class JiraReleaseCreator:
         self.jira_api_token = os.environ.get('JIRA_API_TOKEN')
         
         if not self.jira_username or not self.jira_api_token:
-            print("Error: JIRA_USERNAME and JIRA_API_TOKEN environment variables must be set.")
+            logger.error("Error: JIRA_USERNAME and JIRA_API_TOKEN environment variables must be set.")
             sys.exit(1)
-    
+
+        # Reuse one session so urllib3 can pool and keep-alive connections,
+        # amortizing the TLS handshake over all API calls.
+        self.session = requests.Session()
+        self.session.auth = (self.jira_username, self.jira_api_token)
+        # Ask for compressed responses; urllib3 decodes transparently and
+        # gzip cuts wire bytes several-fold on large search payloads
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        retry = Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=self.RETRY_BACKOFF_FACTOR,
+            status_forcelist=sorted(self.RETRY_STATUSES),
+            allowed_methods=frozenset(['GET', 'POST', 'PUT']),
+            respect_retry_after_header=True
+        )
+        self.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=32, max_retries=retry))
+
     def _make_jira_request(self, url, method='GET', params=None, data=None):
         """
         Make a request to the JIRA API.
@@ -56,149 +92,218 @@ class JiraReleaseCreator:
         Returns:
             dict: The JSON response.
         """
-        auth = (self.jira_username, self.jira_api_token)
-        headers = {'Content-Type': 'application/json'}
-        
         try:
-            if method.upper() == 'GET':
-                response = requests.get(url, auth=auth, headers=headers, params=params)
-            elif method.upper() == 'POST':
-                response = requests.post(url, auth=auth, headers=headers, json=data)
-            elif method.upper() == 'PUT':
-                response = requests.put(url, auth=auth, headers=headers, json=data)
-            else:
-                print(f"Error: Unsupported HTTP method: {method}")
-                sys.exit(1)
-            
+            response = self.session.request(method.upper(), url, params=params, json=data)
             response.raise_for_status()
-            
+
             # Some endpoints return no content
-            if response.status_code == 204 or not response.text:
+            if response.status_code == 204 or not response.content:
                 return {}
-            
-            return response.json()
+
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
-            print(f"Error making request to JIRA API: {e}")
+            logger.error(f"Error making request to JIRA API: {e}")
             if hasattr(e, 'response') and e.response:
-                print(f"Response status code: {e.response.status_code}")
-                print(f"Response body: {e.response.text}")
+                logger.error(f"Response status code: {e.response.status_code}")
+                logger.error(f"Response body: {e.response.text}")
             sys.exit(1)
     
-    def get_current_user(self):
+    async def _make_jira_request_async(self, session, url, method='GET', params=None, data=None):
         """
-        Get the current user's information.
-        
+        Make a request to the JIRA API using an aiohttp session.
+
+        Args:
+            session (aiohttp.ClientSession): The session to issue the request through.
+            url (str): The URL to request.
+            method (str): The HTTP method to use (GET, POST, PUT).
+            params (dict, optional): Query parameters. Defaults to None.
+            data (dict, optional): JSON data for POST/PUT requests. Defaults to None.
+
         Returns:
-            dict: The current user's information.
+            dict: The JSON response.
         """
-        url = f"{self.jira_base_url}/rest/api/2/myself"
-        return self._make_jira_request(url)
-    
+        auth = aiohttp.BasicAuth(self.jira_username, self.jira_api_token)
+
+        try:
+            for attempt in range(self.MAX_RETRIES + 1):
+                async with session.request(method, url, auth=auth, params=params, json=data) as response:
+                    # Back off and retry on rate limits and transient server
+                    # errors, honoring Retry-After when JIRA sends one
+                    if response.status in self.RETRY_STATUSES and attempt < self.MAX_RETRIES:
+                        retry_after = response.headers.get('Retry-After')
+                        if retry_after is not None:
+                            delay = float(retry_after)
+                        else:
+                            delay = self.RETRY_BACKOFF_FACTOR * (2 ** attempt)
+                        await asyncio.sleep(delay)
+                        continue
+
+                    response.raise_for_status()
+
+                    # Some endpoints return no content
+                    body = await response.read()
+                    if response.status == 204 or not body:
+                        return {}
+
+                    return orjson.loads(body)
+        except aiohttp.ClientError as e:
+            logger.error(f"Error making request to JIRA API: {e}")
+            if isinstance(e, aiohttp.ClientResponseError):
+                logger.error(f"Response status code: {e.status}")
+            sys.exit(1)
+
+    def _get_project_id(self):
+        """
+        Get the numeric ID of the project, fetching it once and caching it.
+
+        Returns:
+            str: The project ID.
+        """
+        if not hasattr(self, '_project_id'):
+            url = f"{self.jira_base_url}/rest/api/2/project/{self.project_name}"
+            self._project_id = self._make_jira_request(url)['id']
+        return self._project_id
+
     def create_release(self):
         """
         Create a new release in the specified project.
-        
+
         Returns:
             dict: The created release information.
         """
-        # Get current user to set as the release owner
-        current_user = self.get_current_user()
-        
-        # Create the release
+        # JIRA assigns the creating user as the release owner, so there is
+        # no need to look it up and set it explicitly.
         url = f"{self.jira_base_url}/rest/api/2/version"
         data = {
             "name": self.release_name,
-            "project": self.project_name,
             "released": False,
             "userReleaseDate": datetime.now().strftime("%Y-%m-%d"),
-            "projectId": None  # This will be determined by the project name
+            "projectId": int(self._get_project_id())
         }
-        
-        # Add owner if available
-        if current_user and 'key' in current_user:
-            data["owner"] = current_user['key']
-        
-        print(f"Creating release '{self.release_name}' in project '{self.project_name}'...")
+
+        logger.info(f"Creating release '{self.release_name}' in project '{self.project_name}'...")
         response = self._make_jira_request(url, method='POST', data=data)
         
-        print(f"Release created successfully: {response.get('name', self.release_name)}")
+        logger.info(f"Release created successfully: {response.get('name', self.release_name)}")
         return response
     
-    def get_tickets_with_status(self):
+    async def get_tickets_with_status(self, session):
         """
         Get all tickets with the specified status in the project.
-        
+
+        JIRA Cloud caps each search response at 100 issues regardless of the
+        requested maxResults, so the results are paged with startAt. The pages
+        are independent once the total is known, so they are fetched
+        concurrently and concatenated in offset order.
+
+        Args:
+            session (aiohttp.ClientSession): The session to issue requests through.
+
         Returns:
             list: A list of JIRA issue objects.
         """
         # JQL query to find all issues with the specified status in the project
         jql = f'project = "{self.project_name}" AND status = "{self.ticket_status}" ORDER BY created ASC'
         url = f"{self.jira_base_url}/rest/api/2/search"
-        params = {
-            'jql': jql,
-            'fields': 'key,summary,status,fixVersions',
-            'maxResults': 1000
-        }
-        
-        response = self._make_jira_request(url, params=params)
-        issues = response.get('issues', [])
-        
-        print(f"Found {len(issues)} issues with status '{self.ticket_status}' in project '{self.project_name}'")
+        page_size = 100
+
+        # First ask only for the total so the page offsets can be computed
+        params = {'jql': jql, 'maxResults': 0}
+        total = (await self._make_jira_request_async(session, url, params=params)).get('total', 0)
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def fetch_page(start_at):
+            params = {
+                'jql': jql,
+                'fields': 'key',
+                'maxResults': page_size,
+                'startAt': start_at
+            }
+            async with semaphore:
+                response = await self._make_jira_request_async(session, url, params=params)
+            return response.get('issues', [])
+
+        pages = await asyncio.gather(*[fetch_page(offset) for offset in range(0, total, page_size)])
+        issues = [issue for page in pages for issue in page]
+
+        logger.info(f"Found {len(issues)} issues with status '{self.ticket_status}' in project '{self.project_name}'")
         return issues
     
-    def add_fix_version_to_tickets(self, release_id, issues):
+    # JIRA's bulk edit endpoint accepts at most 1000 issues per request.
+    BULK_EDIT_BATCH_SIZE = 1000
+
+    async def add_fix_version_to_tickets(self, session, release_id, issues):
         """
         Add the new release as a fixVersion to the specified tickets.
-        
+
+        Uses JIRA's bulk edit endpoint with ADD semantics, so all issues are
+        updated in a handful of requests instead of one PUT per issue, and
+        existing fixVersions are preserved server-side without a
+        read-modify-write cycle.
+
         Args:
+            session (aiohttp.ClientSession): The session to issue requests through.
             release_id (str): The ID of the created release.
             issues (list): A list of JIRA issue objects.
         """
-        for issue in issues:
-            issue_key = issue['key']
-            
-            # Get current fixVersions
-            current_fix_versions = issue.get('fields', {}).get('fixVersions', [])
-            current_fix_version_ids = [v['id'] for v in current_fix_versions]
-            
-            # Add the new release ID if it's not already there
-            if release_id not in current_fix_version_ids:
-                current_fix_version_ids.append(release_id)
-                
-                # Update the issue
-                url = f"{self.jira_base_url}/rest/api/2/issue/{issue_key}"
-                data = {
-                    "fields": {
-                        "fixVersions": [{"id": version_id} for version_id in current_fix_version_ids]
+        # ADD is idempotent server-side, so no need to check current fixVersions
+        issue_keys = [issue['key'] for issue in issues]
+        if not issue_keys:
+            return
+
+        url = f"{self.jira_base_url}/rest/api/3/bulk/issues/fields"
+        batches = [
+            issue_keys[start:start + self.BULK_EDIT_BATCH_SIZE]
+            for start in range(0, len(issue_keys), self.BULK_EDIT_BATCH_SIZE)
+        ]
+
+        async def edit_batch(batch):
+            data = {
+                "selectedIssueIdsOrKeys": batch,
+                "selectedActions": ["fixVersions"],
+                "editedFieldsInput": {
+                    "fixVersions": {
+                        "bulkEditMultiSelectFieldOption": "ADD",
+                        "fields": [{"versionId": release_id}]
                     }
                 }
-                
-                self._make_jira_request(url, method='PUT', data=data)
-                print(f"Added fixVersion to issue {issue_key}")
-            else:
-                print(f"Issue {issue_key} already has the fixVersion")
-    
+            }
+            await self._make_jira_request_async(session, url, method='POST', data=data)
+            logger.debug(f"Added fixVersion to {len(batch)} issues")
+
+        await asyncio.gather(*[edit_batch(batch) for batch in batches])
+
     def run(self):
         """
         Run the JIRA Release Creator.
         """
-        print(f"Starting JIRA Release Creator")
-        
+        asyncio.run(self._run_async())
+
+    async def _run_async(self):
+        """
+        Run the JIRA Release Creator.
+        """
+        logger.info("Starting JIRA Release Creator")
+
         # Step 1: Create the release
         release = self.create_release()
         release_id = release.get('id')
-        
+
         if not release_id:
-            print("Error: Failed to get release ID from the created release")
+            logger.error("Error: Failed to get release ID from the created release")
             sys.exit(1)
-        
-        # Step 2: Get tickets with the specified status
-        issues = self.get_tickets_with_status()
-        
-        # Step 3: Add the release as a fixVersion to the tickets
-        self.add_fix_version_to_tickets(release_id, issues)
-        
-        print(f"JIRA Release Creator completed successfully!")
+
+        connector = aiohttp.TCPConnector(limit=self.MAX_CONCURRENT_REQUESTS)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Step 2: Get tickets with the specified status
+            issues = await self.get_tickets_with_status(session)
+
+            # Step 3: Add the release as a fixVersion to the tickets
+            await self.add_fix_version_to_tickets(session, release_id, issues)
+
+        logger.info("JIRA Release Creator completed successfully!")
+        # Single summary line instead of per-issue output
         print(f"Created release '{self.release_name}' and added it as a fixVersion to {len(issues)} issues")
 
 def main():
@@ -206,8 +311,14 @@ def main():
     parser.add_argument('--release-name', required=True, help='Name of the release to create')
     parser.add_argument('--project', required=True, help='JIRA project key')
     parser.add_argument('--status', required=True, help='Status of tickets to update')
-    
+    parser.add_argument('--verbose', action='store_true', help='Enable debug logging')
+
     args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(message)s'
+    )
     
     creator = JiraReleaseCreator(
         release_name=args.release_name,